@@ -1,6 +1,7 @@
 import json
 import logging
 import os
+import sys
 import time
 
 from oauthlib.oauth2 import TokenExpiredError, WebApplicationClient, BackendApplicationClient, LegacyApplicationClient
@@ -14,7 +15,7 @@ from requests.packages.urllib3.util.retry import Retry
 from requests_oauthlib import OAuth2Session
 from stringcase import pascalcase, camelcase, snakecase
 from tzlocal import get_localzone
-from zoneinfo import ZoneInfoNotFoundError
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from .utils import ME_RESOURCE, BaseTokenBackend, FileSystemTokenBackend, Token
 import datetime as dt
 
@@ -82,7 +83,7 @@ class Protocol:
         :param function casing_function: the casing transform function to be
          used on api keywords (camelcase / pascalcase)
         :param str protocol_scope_prefix: prefix url for scopes
-        :param datetime.timezone.utc or str timezone: preferred timezone, defaults to the
+        :param ZoneInfo or str timezone: preferred timezone, defaults to the
          system timezone
         :raises ValueError: if protocol_url or api_version are not supplied
         """
@@ -96,13 +97,17 @@ class Protocol:
         self.default_resource = default_resource or ME_RESOURCE
         self.use_default_casing = True if casing_function is None else False
         self.casing_function = casing_function or camelcase
+        self._casing_cache = {}  # api keywords already converted by casing_function
         if timezone and isinstance(timezone, str):
-            timezone = dt.timezone(timezone)
+            timezone = ZoneInfo(timezone)
         try:
-            self.timezone = timezone or get_localzone() 
+            timezone = timezone or get_localzone()
         except ZoneInfoNotFoundError as e:
             log.debug('Timezone not provided and the local timezone could not be found. Default to UTC.')
-            self.timezone = dt.timezone.utc
+            timezone = dt.timezone.utc
+        # tzlocal<5 returns pytz compatible shims that wrap a ZoneInfo
+        unwrap_shim = getattr(timezone, 'unwrap_shim', None)
+        self.timezone = unwrap_shim() if unwrap_shim is not None else timezone
         self.max_top_value = 500  # Max $top parameter value
 
         # define any keyword that can be different in this protocol
@@ -135,7 +140,13 @@ class Protocol:
         :return: key after case conversion
         :rtype: str
         """
-        return key if self.use_default_casing else self.casing_function(key)
+        if self.use_default_casing:
+            return key
+        converted = self._casing_cache.get(key)
+        if converted is None:
+            # interned so every converted key shares a single string object
+            converted = self._casing_cache[key] = sys.intern(self.casing_function(key))
+        return converted
 
     @staticmethod
     def to_api_case(key):
@@ -3,7 +3,7 @@ import logging
 from enum import Enum
 
 # noinspection PyPep8Naming
-from bs4 import BeautifulSoup as bs
+from bs4 import BeautifulSoup as bs, SoupStrainer
 from dateutil.parser import parse
 from pathlib import Path
 
@@ -15,6 +15,31 @@ from .category import Category
 
 log = logging.getLogger(__name__)
 
+# shared defaults for missing cloud data. Only read from, never mutate them.
+_EMPTY_DICT = {}
+_EMPTY_TUPLE = ()
+
+try:
+    # the C backed lxml parser is much faster than html.parser when available
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+
+def _parse_cloud_dt(value, tz):
+    """ Parses a cloud datetime string and converts it to the given timezone
+
+    The api returns ISO 8601 strings (eg. '2023-06-01T12:34:56Z') so the fast
+    datetime.fromisoformat is tried first, falling back to dateutil for
+    non standard values.
+    """
+    try:
+        date_time = dt.datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        date_time = parse(value)
+    return date_time.astimezone(tz)
+
 
 class RecipientType(Enum):
     TO = 'to'
@@ -114,13 +139,13 @@ class MessageFlag(ApiComponent):
 
         self.__status = Flag.from_value(flag_data.get(self._cc('flagStatus'), 'notFlagged'))
 
-        start_obj = flag_data.get(self._cc('startDateTime'), {})
+        start_obj = flag_data.get(self._cc('startDateTime'), _EMPTY_DICT)
         self.__start = self._parse_date_time_time_zone(start_obj)
 
-        due_date_obj = flag_data.get(self._cc('dueDateTime'), {})
+        due_date_obj = flag_data.get(self._cc('dueDateTime'), _EMPTY_DICT)
         self.__due_date = self._parse_date_time_time_zone(due_date_obj)
 
-        completed_date_obj = flag_data.get(self._cc('completedDateTime'), {})
+        completed_date_obj = flag_data.get(self._cc('completedDateTime'), _EMPTY_DICT)
         self.__completed = self._parse_date_time_time_zone(completed_date_obj)
 
     def __repr__(self):
@@ -259,7 +284,7 @@ class Message(ApiComponent, AttachableMixin, HandleRecipientsMixin):
 
         download_attachments = kwargs.get('download_attachments')
 
-        cloud_data = kwargs.get(self._cloud_data_key, {})
+        cloud_data = kwargs.get(self._cloud_data_key, _EMPTY_DICT)
         cc = self._cc  # alias to shorten the code
 
         # internal to know which properties need to be updated on the server
@@ -268,31 +293,27 @@ class Message(ApiComponent, AttachableMixin, HandleRecipientsMixin):
 
         self.__inferenceClassification = cloud_data.get(cc('inferenceClassification'), None)
 
-        self.__created = cloud_data.get(cc('createdDateTime'), None)
-        self.__modified = cloud_data.get(cc('lastModifiedDateTime'), None)
-        self.__received = cloud_data.get(cc('receivedDateTime'), None)
-        self.__sent = cloud_data.get(cc('sentDateTime'), None)
-
-        local_tz = self.protocol.timezone
-        self.__created = parse(self.__created).astimezone(
-            local_tz) if self.__created else None
-        self.__modified = parse(self.__modified).astimezone(
-            local_tz) if self.__modified else None
-        self.__received = parse(self.__received).astimezone(
-            local_tz) if self.__received else None
-        self.__sent = parse(self.__sent).astimezone(
-            local_tz) if self.__sent else None
-
-        self.__attachments = MessageAttachments(parent=self, attachments=[])
-        self.__attachments.add({self._cloud_data_key: cloud_data.get(cc('attachments'), [])})
+        # datetimes are kept as cloud strings and parsed on first access
+        self.__created_raw = cloud_data.get(cc('createdDateTime'), None)
+        self.__modified_raw = cloud_data.get(cc('lastModifiedDateTime'), None)
+        self.__received_raw = cloud_data.get(cc('receivedDateTime'), None)
+        self.__sent_raw = cloud_data.get(cc('sentDateTime'), None)
+        self.__created = None
+        self.__modified = None
+        self.__received = None
+        self.__sent = None
+
+        # attachments are kept as cloud data and built on first access
+        self.__attachments_raw = cloud_data.get(cc('attachments'), _EMPTY_TUPLE)
+        self.__attachments = None
         self.__has_attachments = cloud_data.get(cc('hasAttachments'), False)
         self.__subject = cloud_data.get(cc('subject'), '')
         self.__body_preview = cloud_data.get(cc('bodyPreview'), '')
-        body = cloud_data.get(cc('body'), {})
+        body = cloud_data.get(cc('body'), _EMPTY_DICT)
         self.__body = body.get(cc('content'), '')
         self.body_type = body.get(cc('contentType'), 'HTML')  # default to HTML for new messages
 
-        unique_body = cloud_data.get(cc('uniqueBody'), {})
+        unique_body = cloud_data.get(cc('uniqueBody'), _EMPTY_DICT)
         self.__unique_body = unique_body.get(cc('content'), '')
         self.unique_body_type = unique_body.get(cc('contentType'), 'HTML')  # default to HTML for new messages
 
@@ -301,14 +322,15 @@ class Message(ApiComponent, AttachableMixin, HandleRecipientsMixin):
 
         self.__sender = self._recipient_from_cloud(
             cloud_data.get(cc('from'), None), field=cc('from'))
-        self.__to = self._recipients_from_cloud(
-            cloud_data.get(cc('toRecipients'), []), field=cc('toRecipients'))
-        self.__cc = self._recipients_from_cloud(
-            cloud_data.get(cc('ccRecipients'), []), field=cc('ccRecipients'))
-        self.__bcc = self._recipients_from_cloud(
-            cloud_data.get(cc('bccRecipients'), []), field=cc('bccRecipients'))
-        self.__reply_to = self._recipients_from_cloud(
-            cloud_data.get(cc('replyTo'), []), field=cc('replyTo'))
+        # recipients are kept as cloud data and built on first access
+        self.__to_raw = cloud_data.get(cc('toRecipients'), _EMPTY_TUPLE)
+        self.__cc_raw = cloud_data.get(cc('ccRecipients'), _EMPTY_TUPLE)
+        self.__bcc_raw = cloud_data.get(cc('bccRecipients'), _EMPTY_TUPLE)
+        self.__reply_to_raw = cloud_data.get(cc('replyTo'), _EMPTY_TUPLE)
+        self.__to = None
+        self.__cc = None
+        self.__bcc = None
+        self.__reply_to = None
         self.__categories = cloud_data.get(cc('categories'), [])
 
         self.__importance = ImportanceLevel.from_value(cloud_data.get(cc('importance'), 'normal') or 'normal')
@@ -334,7 +356,7 @@ class Message(ApiComponent, AttachableMixin, HandleRecipientsMixin):
         self.conversation_index = cloud_data.get(cc('conversationIndex'), None)
         self.folder_id = cloud_data.get(cc('parentFolderId'), None)
 
-        flag_data = cloud_data.get(cc('flag'), {})
+        flag_data = cloud_data.get(cc('flag'), _EMPTY_DICT)
         self.__flag = MessageFlag(parent=self, flag_data=flag_data)
 
         self.internet_message_id = cloud_data.get(cc('internetMessageId'), '')
@@ -448,26 +470,43 @@ class Message(ApiComponent, AttachableMixin, HandleRecipientsMixin):
     @property
     def created(self):
         """ Created time of the message """
+        if self.__created is None and self.__created_raw:
+            self.__created = _parse_cloud_dt(self.__created_raw,
+                                             self.protocol.timezone)
         return self.__created
 
     @property
     def modified(self):
         """ Message last modified time """
+        if self.__modified is None and self.__modified_raw:
+            self.__modified = _parse_cloud_dt(self.__modified_raw,
+                                              self.protocol.timezone)
         return self.__modified
 
     @property
     def received(self):
         """ Message received time"""
+        if self.__received is None and self.__received_raw:
+            self.__received = _parse_cloud_dt(self.__received_raw,
+                                              self.protocol.timezone)
         return self.__received
 
     @property
     def sent(self):
         """ Message sent time"""
+        if self.__sent is None and self.__sent_raw:
+            self.__sent = _parse_cloud_dt(self.__sent_raw,
+                                          self.protocol.timezone)
         return self.__sent
 
     @property
     def attachments(self):
         """ List of attachments """
+        if self.__attachments is None:
+            # added through the constructor so reading this doesn't track a change
+            self.__attachments = MessageAttachments(
+                parent=self,
+                attachments={self._cloud_data_key: self.__attachments_raw})
         return self.__attachments
 
     @property
@@ -499,21 +538,33 @@ class Message(ApiComponent, AttachableMixin, HandleRecipientsMixin):
     @property
     def to(self):
         """ 'TO' list of recipients """
+        if self.__to is None:
+            self.__to = self._recipients_from_cloud(
+                self.__to_raw, field=self._cc('toRecipients'))
         return self.__to
 
     @property
     def cc(self):
         """ 'CC' list of recipients """
+        if self.__cc is None:
+            self.__cc = self._recipients_from_cloud(
+                self.__cc_raw, field=self._cc('ccRecipients'))
         return self.__cc
 
     @property
     def bcc(self):
         """ 'BCC' list of recipients """
+        if self.__bcc is None:
+            self.__bcc = self._recipients_from_cloud(
+                self.__bcc_raw, field=self._cc('bccRecipients'))
         return self.__bcc
 
     @property
     def reply_to(self):
         """ Reply to address """
+        if self.__reply_to is None:
+            self.__reply_to = self._recipients_from_cloud(
+                self.__reply_to_raw, field=self._cc('replyTo'))
         return self.__reply_to
 
     @property
@@ -647,19 +698,20 @@ class Message(ApiComponent, AttachableMixin, HandleRecipientsMixin):
             cc('isDeliveryReceiptRequested'): self.is_delivery_receipt_requested,
         }
 
-        if self.to:
-            message[cc('toRecipients')] = [self._recipient_to_cloud(recipient)
-                                           for recipient in self.to]
-        if self.cc:
-            message[cc('ccRecipients')] = [self._recipient_to_cloud(recipient)
-                                           for recipient in self.cc]
-        if self.bcc:
-            message[cc('bccRecipients')] = [self._recipient_to_cloud(recipient)
-                                            for recipient in self.bcc]
-        if self.reply_to:
-            message[cc('replyTo')] = [self._recipient_to_cloud(recipient) for
-                                      recipient in self.reply_to]
-        if self.attachments:
+        # recipients not yet built and without cloud data are known to be
+        # empty, so there is no need to build them here
+        if (self.__to is not None or self.__to_raw) and self.to:
+            message[cc('toRecipients')] = self._recipients_to_cloud(self.to)
+        if (self.__cc is not None or self.__cc_raw) and self.cc:
+            message[cc('ccRecipients')] = self._recipients_to_cloud(self.cc)
+        if (self.__bcc is not None or self.__bcc_raw) and self.bcc:
+            message[cc('bccRecipients')] = self._recipients_to_cloud(self.bcc)
+        if (self.__reply_to is not None or self.__reply_to_raw) and self.reply_to:
+            message[cc('replyTo')] = self._recipients_to_cloud(self.reply_to)
+        # attachments not yet built and without cloud data are known to be empty
+        has_attachments = bool((self.__attachments is not None or self.__attachments_raw)
+                               and self.attachments)
+        if has_attachments:
             message[cc('attachments')] = self.attachments.to_api_data()
         if self.sender and self.sender.address:
             message[cc('from')] = self._recipient_to_cloud(self.sender)
@@ -671,16 +723,15 @@ class Message(ApiComponent, AttachableMixin, HandleRecipientsMixin):
             # return the whole signature of this message
 
             message[cc('id')] = self.object_id
-            if self.created:
-                message[cc('createdDateTime')] = self.created.astimezone(
-                    dt.timezone.utc).isoformat()
-            if self.received:
-                message[cc('receivedDateTime')] = self.received.astimezone(
-                    dt.timezone.utc).isoformat()
-            if self.sent:
-                message[cc('sentDateTime')] = self.sent.astimezone(
-                    dt.timezone.utc).isoformat()
-            message[cc('hasAttachments')] = bool(self.attachments)
+            # these can't be changed locally so the cloud strings are sent
+            # back as received, with no need to parse and format them
+            if self.__created_raw:
+                message[cc('createdDateTime')] = self.__created_raw
+            if self.__received_raw:
+                message[cc('receivedDateTime')] = self.__received_raw
+            if self.__sent_raw:
+                message[cc('sentDateTime')] = self.__sent_raw
+            message[cc('hasAttachments')] = has_attachments
             message[cc('isRead')] = self.is_read
             message[cc('isDraft')] = self.__is_draft
             message[cc('conversationId')] = self.conversation_id
@@ -1005,20 +1056,17 @@ class Message(ApiComponent, AttachableMixin, HandleRecipientsMixin):
             self.folder_id = message.get(self._cc('parentFolderId'), None)
 
             # fallback to office365 v1.0
-            self.__created = message.get(self._cc('createdDateTime'),
-                                         message.get(
-                                             self._cc('dateTimeCreated'),
-                                             None))
+            self.__created_raw = message.get(self._cc('createdDateTime'),
+                                             message.get(
+                                                 self._cc('dateTimeCreated'),
+                                                 None))
             # fallback to office365 v1.0
-            self.__modified = message.get(self._cc('lastModifiedDateTime'),
-                                          message.get(
-                                              self._cc('dateTimeModified'),
-                                              None))
-
-            self.__created = parse(self.__created).astimezone(
-                self.protocol.timezone) if self.__created else None
-            self.__modified = parse(self.__modified).astimezone(
-                self.protocol.timezone) if self.__modified else None
+            self.__modified_raw = message.get(self._cc('lastModifiedDateTime'),
+                                              message.get(
+                                                  self._cc('dateTimeModified'),
+                                                  None))
+            self.__created = None
+            self.__modified = None
 
             self.web_link = message.get(self._cc('webLink'), '')
         else:
@@ -1036,11 +1084,14 @@ class Message(ApiComponent, AttachableMixin, HandleRecipientsMixin):
             return self.body
 
         try:
-            soup = bs(self.body, 'html.parser')
+            # only the body element is needed so skip building the rest
+            soup = bs(self.body, HTML_PARSER, parse_only=SoupStrainer('body'))
         except RuntimeError:
             return self.body
-        else:
-            return soup.body.text
+        if soup.body is None:
+            # a fragment without <body> (html.parser doesn't add one)
+            return bs(self.body, HTML_PARSER).text
+        return soup.body.text
 
     def get_body_soup(self):
         """ Returns the beautifulsoup4 of the html body
@@ -1051,7 +1102,7 @@ class Message(ApiComponent, AttachableMixin, HandleRecipientsMixin):
         if self.body_type.upper() != 'HTML':
             return None
         else:
-            return bs(self.body, 'html.parser')
+            return bs(self.body, HTML_PARSER)
 
     def get_event(self):
         """ If this is a EventMessage it should return the related Event"""
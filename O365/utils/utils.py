@@ -23,6 +23,9 @@ log = logging.getLogger(__name__)
 
 MAX_RECIPIENTS_PER_MESSAGE = 500  # Actual limit on Office 365
 
+# (CaseEnum class, provided value) -> member, filled by CaseEnum.from_value
+_CASE_ENUM_MEMBERS = {}
+
 
 class CaseEnum(Enum):
     """ A Enum that converts the value to a snake_case casing """
@@ -35,10 +38,20 @@ class CaseEnum(Enum):
     @classmethod
     def from_value(cls, value):
         """ Gets a member by a snaked-case provided value"""
+        # values already in snake_case don't need the casing conversion
+        member = cls._value2member_map_.get(value)
+        if member is not None:
+            return member
+        # other casings (eg. 'notFlagged') are converted once and remembered
+        member = _CASE_ENUM_MEMBERS.get((cls, value))
+        if member is not None:
+            return member
         try:
-            return cls(snakecase(value))
+            member = cls(snakecase(value))
         except ValueError:
             return None
+        _CASE_ENUM_MEMBERS[(cls, value)] = member
+        return member
 
 
 class ImportanceLevel(CaseEnum):
@@ -101,6 +114,12 @@ class TrackerSet(set):
 class Recipient:
     """ A single Recipient """
 
+    __slots__ = ('_address', '_name', '_parent', '_field')
+
+    # bumped on every address change so Recipients can tell when their
+    # address lookup sets may be stale
+    _generation = 0
+
     def __init__(self, address=None, name=None, parent=None, field=None):
         """ Create a recipient with provided information
 
@@ -147,6 +166,7 @@ class Recipient:
     @address.setter
     def address(self, value):
         self._address = value
+        Recipient._generation += 1
         self._track_changes()
 
     @property
@@ -168,6 +188,9 @@ class Recipient:
 class Recipients:
     """ A Sequence of Recipients """
 
+    __slots__ = ('_parent', '_field', '_recipients', '_address_set',
+                 '_address_set_generation', 'untrack')
+
     def __init__(self, recipients=None, parent=None, field=None):
         """ Recipients must be a list of either address strings or
         tuples (name, address) or dictionary elements
@@ -182,6 +205,8 @@ class Recipients:
         self._parent = parent
         self._field = field
         self._recipients = []
+        self._address_set = set()  # addresses of _recipients for fast lookups
+        self._address_set_generation = Recipient._generation
         self.untrack = True
         if recipients:
             self.add(recipients)
@@ -194,7 +219,10 @@ class Recipients:
         return self._recipients[key]
 
     def __contains__(self, item):
-        return item in {recipient.address for recipient in self._recipients}
+        if self._address_set_generation != Recipient._generation:
+            # some recipient address changed since the set was built
+            self._update_address_set()
+        return item in self._address_set
 
     def __bool__(self):
         return bool(len(self._recipients))
@@ -216,9 +244,16 @@ class Recipients:
                                    None) is not None and self.untrack is False:
             self._parent._track_changes.add(self._field)
 
+    def _update_address_set(self):
+        """ Rebuilds the address lookup set after a recipient address
+        changed """
+        self._address_set = {recipient.address for recipient in self._recipients}
+        self._address_set_generation = Recipient._generation
+
     def clear(self):
         """ Clear the list of recipients """
         self._recipients = []
+        self._address_set.clear()
         self._track_changes()
 
     def add(self, recipients):
@@ -229,27 +264,48 @@ class Recipients:
         :type recipients: list[str] or list[tuple] or list[dict]
         """
 
-        if recipients:
-            if isinstance(recipients, str):
-                self._recipients.append(
-                    Recipient(address=recipients, parent=self._parent,
-                              field=self._field))
-            elif isinstance(recipients, Recipient):
-                self._recipients.append(recipients)
-            elif isinstance(recipients, tuple):
-                name, address = recipients
-                if address:
-                    self._recipients.append(
-                        Recipient(address=address, name=name,
-                                  parent=self._parent, field=self._field))
-            elif isinstance(recipients, list):
-                for recipient in recipients:
+        if not recipients:
+            return
+
+        # a single recipient is handled as a list of one
+        if not isinstance(recipients, list):
+            recipients = [recipients]
+
+        parent, field = self._parent, self._field
+        append = self._recipients.append
+        add_address = self._address_set.add
+        count = len(self._recipients)
+
+        try:
+            for recipient in recipients:
+                if not recipient:
+                    continue
+                if isinstance(recipient, str):
+                    recipient = Recipient(address=recipient, parent=parent,
+                                          field=field)
+                elif isinstance(recipient, tuple):
+                    name, address = recipient
+                    if not address:
+                        continue
+                    recipient = Recipient(address=address, name=name,
+                                          parent=parent, field=field)
+                elif isinstance(recipient, list):
+                    # nested lists are still supported
                     self.add(recipient)
-            else:
-                raise ValueError('Recipients must be an address string, a '
-                                 'Recipient instance, a (name, address) '
-                                 'tuple or a list')
-            self._track_changes()
+                    continue
+                elif not isinstance(recipient, Recipient):
+                    raise ValueError('Recipients must be an address string, a '
+                                     'Recipient instance, a (name, address) '
+                                     'tuple or a list')
+                append(recipient)
+                add_address(recipient.address)
+        except ValueError:
+            # recipients added before the invalid one must still be tracked
+            if len(self._recipients) != count:
+                self._track_changes()
+            raise
+
+        self._track_changes()
 
     def remove(self, address):
         """ Remove an address or multiple addresses
@@ -257,18 +313,19 @@ class Recipients:
         :param address: list of addresses to remove
         :type address: str or list[str]
         """
-        recipients = []
         if isinstance(address, str):
             address = {address}  # set
         elif isinstance(address, (list, tuple)):
             address = set(address)
 
-        for recipient in self._recipients:
-            if recipient.address not in address:
-                recipients.append(recipient)
+        recipients = [recipient for recipient in self._recipients
+                      if recipient.address not in address]
         if len(recipients) != len(self._recipients):
             self._track_changes()
+        # rebind instead of filtering in place so iterators over the
+        # previous list (eg. removing while iterating) are not disturbed
         self._recipients = recipients
+        self._address_set -= address
 
     def get_first_recipient_with_address(self):
         """ Returns the first recipient found with a non blank address
@@ -276,12 +333,8 @@ class Recipients:
         :return: First Recipient
         :rtype: Recipient
         """
-        recipients_with_address = [recipient for recipient in self._recipients
-                                   if recipient.address]
-        if recipients_with_address:
-            return recipients_with_address[0]
-        else:
-            return None
+        return next((recipient for recipient in self._recipients
+                     if recipient.address), None)
 
 
 class HandleRecipientsMixin:
@@ -308,16 +361,32 @@ class HandleRecipientsMixin:
         else:
             return Recipient()
 
+    @staticmethod
+    def _build_recipient_cloud_data(recipient, email_key, address_key, name_key):
+        """ Transforms a Recipient object to a cloud dict using the
+        already converted keys """
+        if not recipient:
+            return None
+        email_address = {address_key: recipient.address}
+        if recipient.name:
+            email_address[name_key] = recipient.name
+        return {email_key: email_address}
+
+    def _recipient_cloud_keys(self):
+        """ Returns the converted emailAddress, address and name keys """
+        cc = self._cc
+        return cc('emailAddress'), cc('address'), cc('name')
+
     def _recipient_to_cloud(self, recipient):
         """ Transforms a Recipient object to a cloud dict """
-        data = None
-        if recipient:
-            data = {self._cc('emailAddress'): {
-                self._cc('address'): recipient.address}}
-            if recipient.name:
-                data[self._cc('emailAddress')][
-                    self._cc('name')] = recipient.name
-        return data
+        return self._build_recipient_cloud_data(recipient, *self._recipient_cloud_keys())
+
+    def _recipients_to_cloud(self, recipients):
+        """ Transforms a sequence of Recipient objects to a list of
+        cloud dicts """
+        keys = self._recipient_cloud_keys()
+        build = self._build_recipient_cloud_data
+        return [build(recipient, *keys) for recipient in recipients]
 
 
 class ApiComponent:
@@ -459,10 +528,9 @@ class ApiComponent:
 
     def _build_date_time_time_zone(self, date_time):
         """ Converts a datetime to a dateTimeTimeZone resource """
-        timezone = date_time.tzinfo.zone if date_time.tzinfo is not None else None
         return {
             self._cc('dateTime'): date_time.strftime('%Y-%m-%dT%H:%M:%S'),
-            self._cc('timeZone'): get_windows_tz(timezone or self.protocol.timezone)
+            self._cc('timeZone'): get_windows_tz(date_time.tzinfo or self.protocol.timezone)
         }
 
     def new_query(self, attribute=None):
@@ -606,7 +606,7 @@ WIN_TO_IANA = {v: k for k, v in IANA_TO_WIN.items() if v != 'UTC' or (v == 'UTC'
 
 
 def get_iana_tz(windows_tz):
-    """ Returns a valid pytz TimeZone (Iana/Olson Timezones) from a given
+    """ Returns a valid Iana/Olson TimeZone name from a given
     windows TimeZone
 
     :param windows_tz: windows format timezone usually returned by
@@ -629,15 +629,18 @@ def get_iana_tz(windows_tz):
 
 
 def get_windows_tz(iana_tz):
-    """ Returns a valid windows TimeZone from a given pytz TimeZone
-    (Iana/Olson Timezones)
+    """ Returns a valid windows TimeZone from a given ZoneInfo TimeZone
+    or name (Iana/Olson Timezones)
     Note: Windows Timezones are SHIT!... no ... really THEY ARE
     HOLY FUCKING SHIT!.
     """
-    timezone = IANA_TO_WIN.get(
-        iana_tz.zone if isinstance(iana_tz, tzinfo) else iana_tz)
+    if isinstance(iana_tz, tzinfo):
+        # ZoneInfo exposes the name as 'key'. Other tzinfo objects (tzlocal<5
+        # pytz shims, datetime.timezone.utc) return their name from str()
+        iana_tz = getattr(iana_tz, 'key', None) or str(iana_tz)
+    timezone = IANA_TO_WIN.get(iana_tz)
     if timezone is None:
         raise ZoneInfoNotFoundError(
-            "Can't find Iana TimeZone " + iana_tz.zone)
+            "Can't find Iana TimeZone " + str(iana_tz))
 
     return timezone
@@ -1,10 +1,13 @@
+import datetime as dt
 import io
+import pickle
+import pytest
 from unittest import mock
 from collections import namedtuple, deque
 
 from O365.connection import MSGraphProtocol
-from O365.message import Flag, Message
-from O365.utils import ImportanceLevel
+from O365.message import Flag, Message, _parse_cloud_dt
+from O365.utils import HandleRecipientsMixin, ImportanceLevel, Recipients
 
 
 class TestMessageData:
@@ -28,6 +31,17 @@ class TestMessageData:
         assert msg.attachments[0].name == "filename.txt"
         msg.attachments.remove(["filename.txt"])
 
+    def test_attachments_from_cloud(self):
+        msg = message(
+            __cloud_data__={
+                "id": "123",
+                "hasAttachments": True,
+                "attachments": [{"id": "a1", "name": "file.txt"}],
+            }
+        )
+        assert [at.name for at in msg.attachments] == ["file.txt"]
+        assert not msg._track_changes  # reading attachments doesn't change the message
+
     def test_properties(self):
         msg = message(
             __cloud_data__={
@@ -64,6 +78,77 @@ class TestMessageData:
         assert msg.flag.status is Flag.NotFlagged
         assert msg.importance is ImportanceLevel.Normal
 
+    def test_dates(self):
+        msg = message(
+            __cloud_data__={
+                "createdDateTime": "2023-06-01T12:34:56Z",
+                "receivedDateTime": "2023-06-01T12:34:56.1234567Z",
+                "sentDateTime": "2023-06-01T14:34:56+02:00",
+            }
+        )
+        expected = dt.datetime(2023, 6, 1, 12, 34, 56, tzinfo=dt.timezone.utc)
+        assert msg.created == expected
+        assert msg.received == expected.replace(microsecond=123456)
+        assert msg.sent == expected
+        assert msg.created.tzinfo is msg.protocol.timezone
+
+    def test_dates_are_parsed_on_first_access(self):
+        with mock.patch("O365.message._parse_cloud_dt", wraps=_parse_cloud_dt) as parse:
+            msg = message(__cloud_data__={"createdDateTime": "2023-06-01T12:34:56Z"})
+            assert parse.call_count == 0
+            assert msg.created.year == 2023
+            assert msg.created.year == 2023
+            assert parse.call_count == 1
+
+    def test_recipients(self):
+        msg = message(
+            __cloud_data__={
+                "toRecipients": [
+                    {"emailAddress": {"address": "alice@example.com", "name": "Alice"}},
+                    {"emailAddress": {"address": "bob@example.com"}},
+                ],
+            }
+        )
+        assert [(r.name, r.address) for r in msg.to] == [
+            ("Alice", "alice@example.com"),
+            ("", "bob@example.com"),
+        ]
+        assert "bob@example.com" in msg.to
+        assert msg.to is msg.to
+
+        msg.to.add("carol@example.com")
+        assert "toRecipients" in msg._track_changes
+
+    def test_recipients_add_invalid_tracks_added(self):
+        msg = message(__cloud_data__={"id": "123", "isDraft": True})
+        with pytest.raises(ValueError):
+            msg.to.add(["alice@example.com", {"bad": 1}])
+        assert "alice@example.com" in msg.to
+        assert "toRecipients" in msg._track_changes
+
+    def test_recipients_are_built_on_first_access(self):
+        with mock.patch.object(
+            Message,
+            "_recipients_from_cloud",
+            autospec=True,
+            side_effect=HandleRecipientsMixin._recipients_from_cloud,
+        ) as from_cloud:
+            msg = message(
+                __cloud_data__={"toRecipients": [{"emailAddress": {"address": "alice@example.com"}}]}
+            )
+            assert from_cloud.call_count == 0
+            assert len(msg.to) == 1
+            assert len(msg.to) == 1
+            assert from_cloud.call_count == 1
+
+    def test_importance(self):
+        assert message(__cloud_data__={"importance": "high"}).importance is ImportanceLevel.High
+        assert message(__cloud_data__={"importance": "Low"}).importance is ImportanceLevel.Low
+        assert message(__cloud_data__={"importance": None}).importance is ImportanceLevel.Normal
+        assert ImportanceLevel.from_value("unknown") is None
+        assert Flag.from_value("notFlagged") is Flag.NotFlagged
+        assert Flag.from_value("notFlagged") is Flag.NotFlagged
+
     def test_changes(self):
         msg = message()
         msg.is_read = True
@@ -101,15 +186,44 @@ class TestMessageData:
         assert msg.get_body_soup() is not None
         assert msg.get_body_text() == "content"
 
+    def test_get_body_text_only_reads_body(self, html_parser):
+        msg = message(
+            __cloud_data__={
+                "body": {
+                    "content": "<html><head><title>title</title><style>p {color: red}</style></head>"
+                               "<body><p>content &amp; more</p></body></html>",
+                }
+            }
+        )
+        assert msg.get_body_text() == "content & more"
+
+    def test_get_body_text_without_body_tag(self, html_parser):
+        msg = message(__cloud_data__={"body": {"content": "<p>content</p>"}})
+        assert msg.get_body_text() == "content"
+
+    def test_get_body_soup(self, html_parser):
+        msg = message(__cloud_data__={"body": {"content": "<html><body><p>content</p></body></html>"}})
+        assert msg.get_body_soup().find("p").text == "content"
+
+    def test_has_inline_attachments(self, html_parser):
+        msg = message(
+            __cloud_data__={
+                "hasAttachments": False,
+                "body": {"content": '<html><body><img src="cid:image001.png"></body></html>'},
+            }
+        )
+        assert msg.has_attachments is True
+
     def test_to_api_data(self):
         msg = message(
             __cloud_data__={
                 "id": "123",
                 "isDraft": False,
                 "body": {"content": "<html><body>"},
+                "receivedDateTime": "2023-06-01T12:34:56Z",
             }
         )
-        msg.to.add("alice@example.com")
+        msg.to.add(["alice@example.com", ("Bob", "bob@example.com")])
         msg.cc.add("alice@example.com")
         msg.bcc.add("alice@example.com")
         msg.reply_to.add("alice@example.com")
@@ -127,14 +241,91 @@ class TestMessageData:
             "isReadReceiptRequested": False,
             "subject": "",
             "parentFolderId": None,
+            "receivedDateTime": "2023-06-01T12:34:56Z",
             "from": {"emailAddress": {"address": "alice@example.com"}},
-            "toRecipients": [{"emailAddress": {"address": "alice@example.com"}}],
+            "toRecipients": [
+                {"emailAddress": {"address": "alice@example.com"}},
+                {"emailAddress": {"address": "bob@example.com", "name": "Bob"}},
+            ],
             "bccRecipients": [{"emailAddress": {"address": "alice@example.com"}}],
             "ccRecipients": [{"emailAddress": {"address": "alice@example.com"}}],
             "replyTo": [{"emailAddress": {"address": "alice@example.com"}}],
         }
 
 
+class TestRecipients:
+    def test_contains(self):
+        recipients = Recipients(["alice@example.com", "bob@example.com"])
+        assert "alice@example.com" in recipients
+        assert "carol@example.com" not in recipients
+
+        recipients[1].address = "dave@example.com"
+        assert "bob@example.com" not in recipients
+        assert "dave@example.com" in recipients
+
+    def test_contains_with_shared_recipient(self):
+        recipients = Recipients(["alice@example.com", "bob@example.com"])
+        other = Recipients()
+        other.add(recipients[0])
+
+        recipients[0].address = "new@example.com"
+        assert "new@example.com" in recipients
+        assert "alice@example.com" not in recipients
+        assert "new@example.com" in other
+
+        other.remove("new@example.com")
+        recipients[0].address = "alice@example.com"
+        assert "alice@example.com" in recipients
+        assert "alice@example.com" not in other
+
+    def test_pickle(self):
+        recipients = pickle.loads(pickle.dumps(Recipients(["alice@example.com"])))
+        assert "alice@example.com" in recipients
+
+    def test_add(self):
+        recipients = Recipients()
+        recipients.add([("Eve", "eve@example.com"), "", ("Nobody", ""), ["frank@example.com"]])
+        assert [(r.name, r.address) for r in recipients] == [
+            ("Eve", "eve@example.com"),
+            ("", "frank@example.com"),
+        ]
+        with pytest.raises(ValueError):
+            recipients.add([{"address": "eve@example.com"}])
+
+    def test_remove(self):
+        recipients = Recipients(["alice@example.com", "bob@example.com", "carol@example.com"])
+        recipients.remove(["alice@example.com", "carol@example.com"])
+        assert [r.address for r in recipients] == ["bob@example.com"]
+        assert "alice@example.com" not in recipients
+
+    def test_remove_while_iterating(self):
+        recipients = Recipients(["a@example.com", "b@example.com", "c@example.com", "d@example.com"])
+        for recipient in recipients:
+            recipients.remove(recipient.address)
+        assert len(recipients) == 0
+
+    def test_clear_while_iterating(self):
+        recipients = Recipients(["a@example.com", "b@example.com"])
+        seen = []
+        for recipient in recipients:
+            seen.append(recipient.address)
+            recipients.clear()
+        assert seen == ["a@example.com", "b@example.com"]
+
+    def test_clear(self):
+        recipients = Recipients(["alice@example.com"])
+        recipients.clear()
+        assert len(recipients) == 0
+        assert "alice@example.com" not in recipients
+
+    def test_get_first_recipient_with_address(self):
+        recipients = Recipients()
+        assert recipients.get_first_recipient_with_address() is None
+        recipients.add(["alice@example.com", "bob@example.com"])
+        recipients[0].address = ""
+        assert recipients.get_first_recipient_with_address().address == "bob@example.com"
+
+
 class TestMessageApiCalls:
     base_url = MSGraphProtocol().service_url
 
@@ -161,6 +352,8 @@ class TestMessageApiCalls:
             "isReadReceiptRequested": False,
             "subject": "Test",
         }
+        assert msg.object_id == "1"
+        assert msg.created == dt.datetime(2010, 10, 10, 10, 10, 10, tzinfo=dt.timezone.utc)
 
     def test_save_draft_with_with_small_attachment_when_object_id_is_set(self):
         msg = message(__cloud_data__={"id": "123", "isDraft": True})
@@ -276,7 +469,9 @@ class TestMessageApiCalls:
 
     def test_send(self):
         msg = message(__cloud_data__={})
-        assert msg.send(save_to_sent_folder=False)
+        with mock.patch.object(Message, "_recipients_from_cloud") as from_cloud:
+            assert msg.send(save_to_sent_folder=False)
+        from_cloud.assert_not_called()  # empty recipients are not built to send
         [call] = msg.con.calls
         assert call.url == self.base_url + "me/sendMail"
         assert call.payload == {
@@ -310,6 +505,15 @@ class TestMessageApiCalls:
         assert call.url == self.base_url + "me/messages/123/$value"
 
 
+@pytest.fixture(params=["html.parser", "lxml"])
+def html_parser(request, monkeypatch):
+    """ Runs a test with each of the html parsers Message can use """
+    if request.param == "lxml":
+        pytest.importorskip("lxml")
+    monkeypatch.setattr("O365.message.HTML_PARSER", request.param)
+    return request.param
+
+
 def message(**kwargs):
     defaults = dict(
         con=MockConnection(),
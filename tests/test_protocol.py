@@ -1,10 +1,13 @@
 import pytest
 import json
+import warnings
 
-from zoneinfo import ZoneInfoNotFoundError
+import datetime as dt
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from tzlocal import get_localzone
 
 from O365.connection import Connection, Protocol, MSGraphProtocol, MSOffice365Protocol, DEFAULT_SCOPES
+from O365.utils.windows_tz import get_windows_tz
 
 TEST_SCOPES = [
     'Calendars.Read', 'Calendars.Read.Shared', 'Calendars.ReadWrite', 'Calendars.ReadWrite.Shared',
@@ -34,6 +37,30 @@ class TestProtocol:
     def test_to_api_case(self):
         assert(self.proto.to_api_case("CaseTest") == "case_test")
     
+    def test_convert_case(self):
+        assert(self.proto.convert_case("case_test") == "case_test")
+
+        proto = MSOffice365Protocol()
+        assert(proto.convert_case("case_test") == "CaseTest")
+        assert(proto.convert_case("case_test") == "CaseTest")
+        assert(proto._casing_cache == {"case_test": "CaseTest"})
+
+    def test_timezone(self):
+        proto = Protocol(protocol_url="testing", api_version="0.0", timezone="Europe/Madrid")
+        assert(proto.timezone == ZoneInfo("Europe/Madrid"))
+        assert(get_windows_tz(proto.timezone) == "Romance Standard Time")
+        assert(get_windows_tz("Europe/Madrid") == "Romance Standard Time")
+        assert(get_windows_tz(dt.timezone.utc) == "UTC")
+
+    def test_default_timezone(self):
+        proto = Protocol(protocol_url="testing", api_version="0.0")
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")  # eg. pytz shim deprecation warnings
+            try:
+                get_windows_tz(proto.timezone)
+            except ZoneInfoNotFoundError:
+                pass  # the local timezone has no windows equivalent
+
     def test_get_scopes_for(self):
         with pytest.raises(ValueError):
             self.proto.get_scopes_for(123) # should error sicne it's not a list or tuple.